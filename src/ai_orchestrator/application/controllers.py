@@ -17,6 +17,10 @@ from ai_orchestrator.domain.services import OrchestratorService, McpStartupServi
 
 logger = logging.getLogger(__name__)
 
+# Project identifier in brackets at the start of an issue summary
+# Example: "[backend] Add authentication" -> "backend"
+_PROJECT_IDENTIFIER_RE = re.compile(r"^\[([^\]]+)\]\s*")
+
 
 class JiraIssuePriority(TypedDict, total=False):
     self: str
@@ -84,9 +88,7 @@ class IssueController:
             summary = ""
 
         # Pattern: [identifier] at the start of summary
-        # Example: "[backend] Add authentication" -> "backend"
-        bracket_pattern = r"^\[([^\]]+)\]\s*"
-        match = re.match(bracket_pattern, summary.strip())
+        match = _PROJECT_IDENTIFIER_RE.match(summary.strip())
         if match:
             raw_identifier = match.group(1).strip()
             normalized = IssueController._normalize_identifier(raw_identifier)
@@ -293,7 +295,7 @@ class IssueController:
             team_architecture_rules_url=url_mapping["team_architecture_rules_url"],
         )
 
-    def handle_issue_created(self, payload: JiraIssueWebhookPayload) -> None:
+    async def handle_issue_created(self, payload: JiraIssueWebhookPayload) -> None:
         """
         Entry point for the 'issue-created' webhook.
 
@@ -320,7 +322,7 @@ class IssueController:
             event_dto = IssueEventDTO(issue=issue_entity, event_type="issue_created")
 
             # Delegate to orchestrator service
-            self.orchestrator_service.handle_issue_created(event_dto)
+            await self.orchestrator_service.handle_issue_created(event_dto)
 
             logger.info("Successfully processed issue-created webhook for %s", issue_entity.key)
 
@@ -333,7 +335,7 @@ class IssueController:
             # Re-raise to allow FastAPI to return appropriate error response
             raise
 
-    def handle_issue_updated(self, payload: JiraIssueWebhookPayload) -> None:
+    async def handle_issue_updated(self, payload: JiraIssueWebhookPayload) -> None:
         """
         Entry point for the 'issue-updated' webhook.
 
@@ -360,7 +362,7 @@ class IssueController:
             event_dto = IssueEventDTO(issue=issue_entity, event_type="issue_updated")
 
             # Delegate to orchestrator service
-            self.orchestrator_service.handle_issue_updated(event_dto)
+            await self.orchestrator_service.handle_issue_updated(event_dto)
 
             logger.info("Successfully processed issue-updated webhook for %s", issue_entity.key)
 
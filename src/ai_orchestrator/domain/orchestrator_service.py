@@ -318,7 +318,7 @@ class OrchestratorService:
 
         return instructions
 
-    def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
+    async def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
         """
         Assign an agent for the given issue using the provided prompt.
 
@@ -329,9 +329,9 @@ class OrchestratorService:
         full_prompt = self.build_agent_prompt(issue=issue, base_prompt=prompt)
 
         # Delegate to the repository to trigger the agent run
-        self.llm_repository.assign_agent(issue=issue, prompt=full_prompt)
+        await self.llm_repository.assign_agent(issue=issue, prompt=full_prompt)
 
-    def handle_issue_created(self, event: IssueEventDTO) -> None:
+    async def handle_issue_created(self, event: IssueEventDTO) -> None:
         """
         Handle a newly created issue event.
 
@@ -348,11 +348,11 @@ class OrchestratorService:
         # Map DTO to domain Issue (already done - event.issue is IssueEntity)
         # Delegate to assignAgent with status-appropriate base prompt
         base_prompt = self._get_base_prompt_for_status(issue.status)
-        self.assign_agent(issue=issue, prompt=base_prompt)
+        await self.assign_agent(issue=issue, prompt=base_prompt)
 
         logger.info("Successfully assigned agent for created issue %s", issue.key)
 
-    def handle_issue_updated(self, event: IssueEventDTO) -> None:
+    async def handle_issue_updated(self, event: IssueEventDTO) -> None:
         """
         Handle an updated issue event.
 
@@ -382,7 +382,7 @@ class OrchestratorService:
 
         # Domain rules passed - delegate to assignAgent with status-appropriate base prompt
         base_prompt = self._get_base_prompt_for_status(issue.status)
-        self.assign_agent(issue=issue, prompt=base_prompt)
+        await self.assign_agent(issue=issue, prompt=base_prompt)
 
         logger.info("Successfully assigned agent for updated issue %s", issue.key)
 
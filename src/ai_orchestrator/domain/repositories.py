@@ -28,11 +28,12 @@ class LlmRepository(ABC):
         """Connect the given MCP provider. Implementation details are infra-specific."""
 
     @abstractmethod
-    def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
+    async def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
         """
         Assign or trigger an agent in OpenHands for the given issue.
 
-        The exact behavior will be implemented later.
+        This is a coroutine so callers can run several issues concurrently
+        (e.g. with `asyncio.gather`) without blocking the event loop.
         """
 
 
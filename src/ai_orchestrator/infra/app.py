@@ -19,6 +19,7 @@ from fastapi import FastAPI
 from fastapi import status
 
 from ai_orchestrator.application.controllers import IssueController
+from ai_orchestrator.infra import metrics
 from ai_orchestrator.infra.config import WebhookConfig
 from ai_orchestrator.infra.di import DI
 from ai_orchestrator.infra.jira_client import JiraClient
@@ -71,7 +72,7 @@ class FastAPIApp:
             
             logger.info("New webhook event received: issue-created for issue %s", issue_key)
             # TODO: add payload validation / schema
-            self._issue_controller.handle_issue_created(payload)
+            await self._issue_controller.handle_issue_created(payload)
             return {"status": "ok"}
 
         @self._app.post(
@@ -89,7 +90,7 @@ class FastAPIApp:
                 pass
             
             logger.info("New webhook event received: issue-updated for issue %s", issue_key)
-            self._issue_controller.handle_issue_updated(payload)
+            await self._issue_controller.handle_issue_updated(payload)
             return {"status": "ok"}
 
     def register_webhooks(self) -> None:
@@ -197,6 +198,7 @@ def create_app() -> FastAPI:
         log_file="logs/app.log",
         enable_console=True,
     )
+    metrics.start_reporter()
 
     logger.info("Initializing AI Orchestrator application...")
 
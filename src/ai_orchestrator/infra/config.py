@@ -6,6 +6,8 @@ Loads configuration from environment variables with validation.
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +35,27 @@ class LlmConfig(BaseSettings):
         default=None,
         description="Base URL for LLM endpoints (optional, uses provider default if not set)",
     )
+    max_concurrent_runs: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of agent runs sent to the LLM provider at the same time",
+    )
+    dedupe_ttl_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Skip an agent run whose issue key and prompt match a run in progress or "
+        "finished within this many seconds (0 disables de-duplication)",
+    )
+    max_history_events: int | None = Field(
+        default=None,
+        ge=8,
+        description="Summarize older conversation events once an agent run's history exceeds "
+        "this many events, so each LLM call resends a bounded context (unset keeps full history)",
+    )
+    summary_model: str | None = Field(
+        default=None,
+        description="Cheaper model used to summarize condensed history (defaults to `model`)",
+    )
 
 
 class JiraConfig(BaseSettings):
@@ -131,6 +154,26 @@ class McpConfig(BaseSettings):
 
     command: str = Field(..., description="Command to run MCP server (e.g., npx)")
     args: str = Field(..., description="Arguments for MCP server (e.g., -y,@sooperset/mcp-atlassian)")
+    connection_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="How long a successful MCP connection check is trusted before the MCP environment is re-read and re-verified",
+    )
+    prewarm: bool = Field(
+        default=False,
+        description="Start the MCP server once during connect_mcp and complete the MCP initialize "
+        "handshake, so package download and startup are paid before the first agent run",
+    )
+    prewarm_timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Maximum time to wait for the MCP server to answer the pre-warm handshake",
+    )
+
+    @cached_property
+    def args_list(self) -> tuple[str, ...]:
+        """`args` split on commas (e.g. "-y,@sooperset/mcp-atlassian"), parsed once."""
+        return tuple(arg.strip() for arg in self.args.split(",") if arg.strip())
 
 
 class OpenHandsConfig(BaseSettings):
@@ -165,6 +208,12 @@ class OpenHandsConfig(BaseSettings):
         description="API key for authenticating with the OpenHands server. "
         "Required if your server requires authentication.",
     )
+    max_connections: int | None = Field(
+        default=None,
+        ge=1,
+        description="Upper bound on the keep-alive HTTP connection pool shared by all "
+        "conversations on the remote server. Unset means no limit.",
+    )
 
     # Local workspace configuration
     use_docker_workspace: bool = Field(
@@ -176,6 +225,12 @@ class OpenHandsConfig(BaseSettings):
         default="/workspace",
         description="Working directory for agent execution (both remote and local Docker).",
     )
+    tool_concurrency_limit: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of tool calls (e.g. MCP Jira/Confluence calls) the agent "
+        "executes concurrently within a single step. 1 runs them sequentially.",
+    )
 
 
 class AppConfig(BaseSettings):
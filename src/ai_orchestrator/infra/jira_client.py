@@ -11,14 +11,95 @@ Supports both:
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 
 from ai_orchestrator.infra.config import JiraConfig
 
+# Events subscribed to when `register_webhook` is called without an explicit list
+_DEFAULT_EVENTS: tuple[str, ...] = ("jira:issue_created", "jira:issue_updated")
+
+# Static part of every webhook registration payload
+_BASE_PAYLOAD_TEMPLATE = MappingProxyType({"excludeBody": False})
+
+# Transparent retries for transient Jira errors. Only idempotent methods are
+# retried so that a webhook POST is never registered twice.
+_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# How long a successful `test_connection` probe is reused before hitting Jira again
+CONNECTION_CHECK_TTL_SECONDS = 30.0
+
+# Successful connection probes: (base_url, username, sha256 of token) -> monotonic expiry time
+_connection_check_cache: dict[tuple[str, str, str], float] = {}
+
+# Status codes meaning the configured credentials were rejected
+_AUTH_ERROR_STATUS_CODES = (401, 403)
+
+
+class CachedBasicAuth(AuthBase):
+    """
+    Basic Auth handler that encodes the Authorization header only once.
+
+    `requests.auth.HTTPBasicAuth` re-encodes the credentials on every request;
+    this variant precomputes the header value and simply attaches it.
+    Use `get_basic_auth()` to share a single instance per credential pair.
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        self.username = username
+        self.password = password
+        token = base64.b64encode(f"{username}:{password}".encode("latin1")).decode("ascii")
+        self._header = f"Basic {token}"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, CachedBasicAuth)
+            and self.username == other.username
+            and self.password == other.password
+        )
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((self.username, self.password))
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self._header
+        return r
+
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session whose connection pool retries transient failures."""
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=_RETRY_POLICY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=32)
+def get_basic_auth(username: str, password: str) -> CachedBasicAuth:
+    """Return the shared `CachedBasicAuth` instance for the given credentials."""
+    return CachedBasicAuth(username, password)
+
 
 class JiraClient:
     """
@@ -34,6 +115,20 @@ class JiraClient:
       - If JIRA_USERNAME is empty/not set: Bearer token authentication (PAT)
     """
 
+    __slots__ = (
+        "config",
+        "base_url",
+        "auth",
+        "logger",
+        "_session",
+        "_is_cloud",
+        "_api_version",
+        "api_base",
+        "_webhook_url",
+        "_myself_url",
+        "_connection_check_key",
+    )
+
     def __init__(self, config: JiraConfig) -> None:
         """
         Initialize Jira client with configuration.
@@ -44,7 +139,7 @@ class JiraClient:
         self.config = config
         self.base_url = config.url.rstrip("/")
         self.logger = logging.getLogger(__name__)
-        self._session = requests.Session()
+        self._session = _build_session()
 
         # Detect if this is Jira Cloud or Server first
         self._is_cloud = self._is_jira_cloud()
@@ -61,6 +156,17 @@ class JiraClient:
         # Detect API version based on Jira type or use configured version
         self._api_version = self._detect_api_version()
 
+        # Base API URL for the detected Jira version, plus the endpoints used per call
+        self.api_base = f"{self.base_url}/rest/api/{self._api_version}"
+        self._webhook_url = f"{self.api_base}/webhook"
+        self._myself_url = f"{self.api_base}/myself"
+        # The token is part of the key so that a rotated or wrong PAT (no username) is re-probed
+        self._connection_check_key = (
+            self.base_url,
+            self.config.username,
+            hashlib.sha256(self.config.api_token.encode()).hexdigest(),
+        )
+
     def _is_jira_cloud(self) -> bool:
         """Check if this is a Jira Cloud instance."""
         return "atlassian.net" in self.base_url.lower()
@@ -86,7 +192,7 @@ class JiraClient:
 
         if self._is_cloud:
             # Jira Cloud: Always use Basic Auth with email + API token
-            self.auth = HTTPBasicAuth(self.config.username, self.config.api_token)
+            self.auth = get_basic_auth(self.config.username, self.config.api_token)
             self._session.auth = self.auth
             self.logger.info("Using Basic Auth for Jira Cloud")
             return
@@ -109,7 +215,7 @@ class JiraClient:
 
     def _use_basic_auth(self) -> None:
         """Configure Basic Auth with username and password/token."""
-        self.auth = HTTPBasicAuth(self.config.username, self.config.api_token)
+        self.auth = get_basic_auth(self.config.username, self.config.api_token)
         self._session.auth = self.auth
         self.logger.info("Using Basic Auth for Jira Server (username + password/token)")
 
@@ -145,11 +251,6 @@ class JiraClient:
             self.logger.info("Detected Jira Server/Data Center - using REST API v2")
             return "2"
 
-    @property
-    def api_base(self) -> str:
-        """Get the base API URL for the detected Jira version."""
-        return f"{self.base_url}/rest/api/{self._api_version}"
-
     def register_webhook(
         self,
         webhook_url: str,
@@ -176,22 +277,21 @@ class JiraClient:
         Raises:
             requests.RequestException: If webhook registration fails
         """
-        if events is None:
-            events = ["jira:issue_created", "jira:issue_updated"]
+        events = list(_DEFAULT_EVENTS) if events is None else events
 
         # Webhook payload format
         payload: dict[str, Any] = {
+            **_BASE_PAYLOAD_TEMPLATE,
             "name": name,
             "url": webhook_url,
             "events": events,
-            "excludeBody": False,
         }
 
         if jql_filter:
             payload["jqlFilter"] = jql_filter
 
         # Use the detected API version
-        url = f"{self.api_base}/webhook"
+        url = self._webhook_url
 
         self.logger.info(
             f"Registering webhook '{name}' at {webhook_url} for events: {', '.join(events)}"
@@ -212,6 +312,8 @@ class JiraClient:
             if e.response.text:
                 error_msg += f" - {e.response.text}"
             self.logger.error(error_msg, exc_info=True)
+            if e.response.status_code in _AUTH_ERROR_STATUS_CODES:
+                _connection_check_cache.pop(self._connection_check_key, None)
             # For Jira Server, webhook registration via API might not be available
             if self._api_version == "2" and e.response.status_code in (403, 404):
                 self.logger.warning(
@@ -224,17 +326,38 @@ class JiraClient:
             self.logger.error(f"Failed to register webhook: {e}", exc_info=True)
             raise
 
-    def test_connection(self) -> bool:
+    def test_connection(self, force: bool = False) -> bool:
         """
         Test connection to Jira API.
 
+        A successful probe is cached for `CONNECTION_CHECK_TTL_SECONDS` so that
+        repeated health checks don't each cost a round-trip to Jira. Failed
+        probes are never cached, and an auth error on any request drops the cached result.
+
+        Args:
+            force: Bypass the cached result and always probe Jira
+
         Returns:
             True if connection successful, False otherwise
         """
+        cache_key = self._connection_check_key
+        if not force and time.monotonic() < _connection_check_cache.get(cache_key, 0.0):
+            self.logger.debug("Using cached Jira connection check for %s", self.base_url)
+            return True
+
+        connected = self._probe_connection()
+        if connected:
+            _connection_check_cache[cache_key] = time.monotonic() + CONNECTION_CHECK_TTL_SECONDS
+        else:
+            _connection_check_cache.pop(cache_key, None)
+        return connected
+
+    def _probe_connection(self) -> bool:
+        """Call the `/myself` endpoint to verify connectivity and credentials."""
         try:
             # Use the detected API version
-            url = f"{self.api_base}/myself"
-            self.logger.debug(f"Testing Jira connection to: {url}")
+            url = self._myself_url
+            self.logger.debug("Testing Jira connection to: %s", url)
             response = self._session.get(url, timeout=10)
             response.raise_for_status()
             user_info = response.json()
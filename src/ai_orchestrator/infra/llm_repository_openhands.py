@@ -19,38 +19,229 @@ MCP Server Configuration:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
 import os
-from typing import Any
-
-from openhands.sdk import Agent, LLM, RemoteConversation
-from openhands.sdk.workspace import RemoteWorkspace
-from openhands.workspace import DockerWorkspace
+import subprocess
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ai_orchestrator.domain.issue_entity import IssueEntity
 from ai_orchestrator.domain.repositories import LlmRepository
+from ai_orchestrator.infra import metrics
 from ai_orchestrator.infra.config import LlmConfig, McpConfig, OpenHandsConfig
 
+# The OpenHands SDK pulls in LiteLLM and the Docker client; it is imported where
+# it is used so that importing this module (e.g. for DI wiring) stays cheap
+if TYPE_CHECKING:
+    from openhands.sdk import LLM, Agent, RemoteConversation
+    from openhands.sdk.workspace import RemoteWorkspace
+    from openhands.workspace import DockerWorkspace
+
 logger = logging.getLogger(__name__)
 
-# MCP provider configuration mapping
-MCP_PROVIDER_ENV_VARS: dict[str, list[str]] = {
-    "atlassian": [
+# MCP provider configuration mapping (sets: immutable, and used in set differences)
+MCP_PROVIDER_ENV_VARS: dict[str, frozenset[str]] = {
+    "atlassian": frozenset((
         "JIRA_URL",
         "JIRA_USERNAME",
         "JIRA_API_TOKEN",
-    ],
+    )),
 }
 
-MCP_PROVIDER_OPTIONAL_ENV_VARS: dict[str, list[str]] = {
-    "atlassian": [
+MCP_PROVIDER_OPTIONAL_ENV_VARS: dict[str, frozenset[str]] = {
+    "atlassian": frozenset((
         "JIRA_USERNAME",  # Optional for PAT auth, but recommended
         "CONFLUENCE_URL",
         "CONFLUENCE_USERNAME",
         "CONFLUENCE_API_TOKEN",
-    ],
+    )),
 }
 
+# Guidance logged when an agent run fails because the LLM rejected our credentials
+_AUTH_ERROR_LOG_TEMPLATE = (
+    "LLM Authentication failed for issue %s. "
+    "Please check:\n"
+    "  1. LLM_API_KEY is set correctly in environment variables\n"
+    "  2. The API key is valid and not expired\n"
+    "  3. The API key has proper permissions for the model '%s'\n"
+    "  4. For Deepseek: Ensure you're using a valid Deepseek API key\n"
+    "Error: %s"
+)
+_AUTH_ERROR_MESSAGE_TEMPLATE = (
+    "LLM Authentication failed for issue %s. "
+    "Please verify LLM_API_KEY is set correctly and valid. "
+    "Model: %s"
+)
+
+# Configuration warnings logged by `_validate_llm_config`
+_MISSING_API_KEY_WARNING = (
+    "LLM_API_KEY is not set. This will cause authentication errors. "
+    "Please set the LLM_API_KEY environment variable with a valid API key. "
+    "For Deepseek, get your API key from https://platform.deepseek.com/"
+)
+_EMPTY_API_KEY_WARNING = (
+    "LLM_API_KEY is set but empty. "
+    "Please provide a valid API key in the LLM_API_KEY environment variable."
+)
+_MISSING_MODEL_WARNING = (
+    "LLM_MODEL is not set or empty. Using default 'deepseek'. "
+    "For Deepseek, you may need to use 'deepseek/deepseek-chat' format. "
+    "Set LLM_MODEL environment variable to override."
+)
+
+# MCP `initialize` request sent on stdin to pre-warm a stdio MCP server
+_MCP_INITIALIZE_REQUEST_ID = 1
+_MCP_INITIALIZE_REQUEST = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": _MCP_INITIALIZE_REQUEST_ID,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "ai-orchestrator", "version": "0.1.0"},
+        },
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _build_atlassian_env() -> Mapping[str, str]:
+    """
+    Read the Atlassian MCP environment variables once for the process.
+
+    Environment variables are startup configuration, so the populated ones
+    are captured on first use and shared read-only by every repository.
+    """
+    env: dict[str, str] = {}
+    for env_var in sorted(MCP_PROVIDER_ENV_VARS["atlassian"] | MCP_PROVIDER_OPTIONAL_ENV_VARS["atlassian"]):
+        value = os.environ.get(env_var)
+        if value:
+            env[env_var] = value
+    return MappingProxyType(env)
+
+
+# Serializes writes to the process-global LLM_BASE_URL environment variable
+_ENV_LOCK = threading.Lock()
+
+
+def _export_llm_base_url(base_url: str) -> None:
+    """Set LLM_BASE_URL for the OpenHands SDK, writing os.environ only if it changes."""
+    if os.environ.get("LLM_BASE_URL") == base_url:
+        return
+    with _ENV_LOCK:
+        if os.environ.get("LLM_BASE_URL") != base_url:
+            os.environ["LLM_BASE_URL"] = base_url
+
+
+@dataclass(frozen=True, slots=True)
+class _LlmKwargs:
+    """
+    Constructor arguments for the OpenHands `LLM`; hashable so it can key the LLM cache.
+
+    OpenHands SDK uses LiteLLM under the hood, which accepts:
+    - model: The model identifier
+    - api_key: API key for authentication
+    - api_base: Custom API endpoint (our `base_url`)
+    """
+
+    model: str
+    api_key: str | None = None
+    api_base: str | None = None
+
+    def as_kwargs(self) -> dict[str, Any]:
+        # Optional settings are only passed when set so that SDK defaults apply
+        return {name: value for name, value in asdict(self).items() if value is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class _AgentKwargs:
+    """
+    Settings for the OpenHands `Agent`; hashable so it can key the agent cache.
+
+    `mcp_servers_key` is the MCP servers config serialized with sorted keys, so
+    that equal configurations hit the same cache entry.
+    """
+
+    llm: _LlmKwargs
+    mcp_servers_key: str | None = None
+    tool_concurrency_limit: int = 1
+    # History condensation; see `LlmConfig.max_history_events`
+    max_history_events: int | None = None
+    summary_llm: _LlmKwargs | None = None
+
+
+@lru_cache(maxsize=32)
+def _get_llm(kwargs: _LlmKwargs) -> LLM:
+    """Return the process-wide LLM for the given settings, creating it on first use."""
+    from openhands.sdk import LLM
+
+    return LLM(**kwargs.as_kwargs())
+
+
+@lru_cache(maxsize=32)
+def _get_agent(kwargs: _AgentKwargs) -> Agent:
+    """Return the process-wide Agent for the given LLM settings and MCP servers."""
+    from openhands.sdk import Agent
+
+    agent_kwargs: dict[str, Any] = {
+        "llm": _get_llm(kwargs.llm),
+        "tools": [],  # Standard tools are empty; MCP provides tools dynamically
+    }
+    # Newer-SDK settings are only passed when changed, so older SDK releases keep working
+    if kwargs.tool_concurrency_limit != 1:
+        agent_kwargs["tool_concurrency_limit"] = kwargs.tool_concurrency_limit
+    if kwargs.mcp_servers_key:
+        agent_kwargs["mcp_servers"] = json.loads(kwargs.mcp_servers_key)
+    if kwargs.max_history_events:
+        from openhands.sdk.context.condenser import LLMSummarizingCondenser
+
+        summary_llm = _get_llm(kwargs.summary_llm or kwargs.llm)
+        agent_kwargs["condenser"] = LLMSummarizingCondenser(
+            # Separate usage id so summary cost is reported apart from the agent's
+            llm=summary_llm.model_copy(update={"usage_id": "condenser"}),
+            max_size=kwargs.max_history_events,
+            keep_first=2,
+        )
+    return Agent(**agent_kwargs)
+
+
+# Pool key host for local Docker workspaces (remote ones use the server URL)
+_DOCKER_POOL_HOST = "docker"
+
+
+@dataclass
+class _PooledWorkspace:
+    """A workspace shared between repositories, with usage bookkeeping."""
+
+    workspace: RemoteWorkspace | DockerWorkspace
+    # Releases the workspace's resources (stops the container / closes the HTTP client)
+    close: Callable[[], None]
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    # Serializes runs inside a Docker container, which is shared by all its users
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class AgentRunResult:
+    """Outcome of a single agent run within a batch."""
+
+    issue: IssueEntity
+    ok: bool
+    error: BaseException | None = None
+
 
 class OpenHandsLlmRepository(LlmRepository):
     """
@@ -64,8 +255,27 @@ class OpenHandsLlmRepository(LlmRepository):
     1. Remote server: If OPENHANDS_SERVER_URL is set, connects to self-hosted OpenHands
     2. Docker workspace: If Docker is available, runs agents in local containers
     3. Simple conversation: Fallback mode without sandboxed execution
+
+    Remote workspaces are pooled per (server_url, api_key, working_dir) and local
+    Docker workspaces per working_dir; both are shared between repository instances.
+    Call `cleanup_idle()` to evict unused ones; `close_all()` runs at exit.
     """
 
+    _WORKSPACE_POOL: ClassVar[dict[tuple[str, str | None, str], _PooledWorkspace]] = {}
+    # Reentrant: `__del__` releases through it and may run from garbage collection
+    # triggered inside a block that already holds it on the same thread
+    _WORKSPACE_POOL_LOCK: ClassVar[threading.RLock] = threading.RLock()
+    # Docker workspaces whose container is being started -> future resolved once it is pooled
+    _WORKSPACE_STARTING: ClassVar[dict[tuple[str, str | None, str], Future[None]]] = {}
+    # sha256(issue key + prompt) -> monotonic time until which a repeat run is skipped
+    _RECENT_RUNS: ClassVar[dict[str, float]] = {}
+    _RECENT_RUNS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    # (model, base_url) -> cap on in-flight agent runs against that LLM provider
+    _RUN_SEMAPHORES: ClassVar[dict[tuple[str, str | None], threading.BoundedSemaphore]] = {}
+    _RUN_SEMAPHORES_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    # Built MCP servers configs: (command, args, env items) -> mcpServers dict
+    _MCP_SERVERS_CACHE: ClassVar[dict[tuple[str, str, frozenset[tuple[str, str]]], dict[str, Any]]] = {}
+
     def __init__(
         self,
         llm_config: LlmConfig,
@@ -87,77 +297,105 @@ class OpenHandsLlmRepository(LlmRepository):
         self._mcp_config = mcp_config
         self._workspace: RemoteWorkspace | DockerWorkspace | None = None
         self._conversation: RemoteConversation | Any = None
-        self._mcp_connected: dict[str, bool] = {}
+        self._workspace_key: tuple[str, str | None, str] | None = None
+        self._agent: Agent | None = None
+        # Guards the shared conversation, which must not be driven by two runs at once
+        self._conversation_lock = threading.Lock()
+        # Serializes runs in a local Docker workspace; replaced by the pool entry's lock
+        self._workspace_lock = threading.Lock()
+        # Caps in-flight agent runs against the LLM provider to avoid rate-limit storms
+        self._run_semaphore = self._provider_semaphore(llm_config)
+        # Connected MCP providers -> monotonic time until which the connection is trusted
+        self._mcp_connected: dict[str, float] = {}
+
+        # Environment variables don't change during the process lifetime, so the
+        # MCP-related ones are read once per process and shared by all repositories
+        self._mcp_env_snapshot = _build_atlassian_env()
+        # Provider -> (all_required_set, missing_vars); see `_check_mcp_env_vars`
+        self._mcp_check_cache: dict[str, tuple[bool, tuple[str, ...]]] = {}
+        self._mcp_servers_config: dict[str, Any] | None = None
 
         # Validate LLM configuration early
         self._validate_llm_config()
 
+        # The OpenHands LLM, agent, workspace and conversation are built lazily on
+        # the first agent run (see `_ensure_conversation`)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
         if client is not None:
             # Allow injecting a pre-configured OpenHands conversation/client
             self._conversation = client
+            self._initialized = True
             logger.info("Using injected OpenHands client for LLM repository")
             return
 
-        # Build LLM from configuration
-        # OpenHands SDK uses LiteLLM under the hood, which accepts:
-        # - model: The model identifier
-        # - api_key: API key for authentication
-        # - base_url: Custom API endpoint (also known as api_base in LiteLLM)
-        llm_kwargs: dict[str, Any] = {
-            "model": llm_config.model,
-        }
-        # Only add api_key if provided (optional - may be configured in OpenHands)
-        if llm_config.api_key:
-            llm_kwargs["api_key"] = llm_config.api_key
-            logger.info("LLM API key configured for model '%s'", llm_config.model)
+        # Build MCP servers configuration once; reused for the lifetime of this repository
+        self._mcp_servers_config = self._build_mcp_servers_config()
+
+    @classmethod
+    def _provider_semaphore(cls, llm_config: LlmConfig) -> threading.BoundedSemaphore:
+        """
+        Return the process-wide run semaphore for the config's LLM provider.
+
+        Shared by every repository using the same (model, base_url), like the LLM
+        itself; its size comes from the first config that creates it.
+        """
+        key = (llm_config.model, llm_config.base_url or None)
+        with cls._RUN_SEMAPHORES_LOCK:
+            semaphore = cls._RUN_SEMAPHORES.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(llm_config.max_concurrent_runs)
+                cls._RUN_SEMAPHORES[key] = semaphore
+        return semaphore
+
+    def _ensure_conversation(self) -> None:
+        """
+        Build the OpenHands LLM, agent, workspace and conversation on first use.
+
+        Construction is deferred until an agent actually has to run, so that
+        creating the repository doesn't pay for Docker/remote workspace startup.
+        Safe to call concurrently; initialization happens exactly once.
+
+        Raises:
+            RuntimeError: If the LLM or the remote OpenHands connection cannot be initialized
+        """
+        if self._initialized:
+            return
+
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._init_conversation()
+            self._initialized = True
+
+    def _init_conversation(self) -> None:
+        """Create the LLM, agent and conversation for the configured execution mode."""
+        llm_config = self._llm_config
+        model, api_key, base_url = llm_config.model, llm_config.api_key, llm_config.base_url
+        openhands_config = self._openhands_config
+
+        # Only pass api_key if provided (optional - may be configured in OpenHands)
+        if api_key:
+            logger.info("LLM API key configured for model '%s'", model)
         else:
             logger.warning(
                 "LLM API key not provided. This may cause authentication errors. "
                 "Set LLM_API_KEY environment variable."
             )
-        # Only add base_url if provided (optional - uses provider default)
+        # Only pass base_url if provided (optional - uses provider default)
         # According to OpenHands documentation, LLM_BASE_URL should be set as environment variable
         # OpenHands SDK reads from environment variables for LLM configuration
         # We also pass it as a parameter for direct SDK usage (LiteLLM uses 'api_base')
-        if llm_config.base_url:
+        if base_url:
             # Set as environment variable (primary method - OpenHands SDK reads this)
-            os.environ["LLM_BASE_URL"] = llm_config.base_url
-            # Also pass as parameter for direct SDK initialization
-            # LiteLLM (used by OpenHands) accepts 'api_base' parameter
-            llm_kwargs["api_base"] = llm_config.base_url
-            logger.info("Using custom LLM base URL: %s (set as LLM_BASE_URL env var and api_base parameter)", llm_config.base_url)
+            _export_llm_base_url(base_url)
+            logger.info("Using custom LLM base URL: %s (set as LLM_BASE_URL env var and api_base parameter)", base_url)
         else:
-            logger.debug("Using default LLM base URL for model '%s'", llm_config.model)
-
-        try:
-            llm = LLM(**llm_kwargs)
-            logger.info("LLM initialized successfully with model '%s'", llm_config.model)
-        except Exception as e:
-            logger.error(
-                "Failed to initialize LLM with model '%s': %s. "
-                "Check LLM_API_KEY and LLM_MODEL environment variables.",
-                llm_config.model,
-                e,
-                exc_info=True,
-            )
-            raise RuntimeError(
-                f"Cannot initialize LLM: {e}. "
-                "Please check LLM_API_KEY and LLM_MODEL configuration."
-            ) from e
+            logger.debug("Using default LLM base URL for model '%s'", model)
 
-        # Build MCP servers configuration if available
-        mcp_servers = self._build_mcp_servers_config()
-
-        # Create agent with LLM and optional MCP servers
-        agent_kwargs: dict[str, Any] = {
-            "llm": llm,
-            "tools": [],  # Standard tools are empty; MCP provides tools dynamically
-        }
-        if mcp_servers:
-            agent_kwargs["mcp_servers"] = mcp_servers
-            logger.info("Configured agent with MCP servers: %s", list(mcp_servers.keys()))
-
-        agent = Agent(**agent_kwargs)
+        agent = self._build_agent()
+        self._agent = agent
 
         # Mode 1: Remote OpenHands server (self-hosted)
         if openhands_config and openhands_config.server_url:
@@ -173,10 +411,61 @@ class OpenHandsLlmRepository(LlmRepository):
         # Mode 3: Simple conversation (fallback)
         self._init_simple_conversation(agent)
 
+    def _build_agent(self) -> Agent:
+        """
+        Return the shared agent for the current LLM settings and MCP servers config.
+
+        Raises:
+            RuntimeError: If the LLM cannot be initialized
+        """
+        llm_config = self._llm_config
+        model, api_key, base_url = llm_config.model, llm_config.api_key, llm_config.base_url
+
+        mcp_servers = self._mcp_servers_config
+        if mcp_servers and logger.isEnabledFor(logging.INFO):
+            logger.info("Configured agent with MCP servers: %s", list(mcp_servers.keys()))
+        mcp_servers_key = json.dumps(mcp_servers, sort_keys=True) if mcp_servers else None
+
+        # LLM and agent are shared by every repository with the same settings
+        summary_model = llm_config.summary_model
+        try:
+            agent = _get_agent(
+                _AgentKwargs(
+                    llm=_LlmKwargs(model=model, api_key=api_key or None, api_base=base_url or None),
+                    mcp_servers_key=mcp_servers_key,
+                    tool_concurrency_limit=(
+                        self._openhands_config.tool_concurrency_limit if self._openhands_config else 1
+                    ),
+                    max_history_events=llm_config.max_history_events,
+                    summary_llm=(
+                        _LlmKwargs(model=summary_model, api_key=api_key or None, api_base=base_url or None)
+                        if summary_model
+                        else None
+                    ),
+                )
+            )
+            logger.info("LLM initialized successfully with model '%s'", model)
+        except Exception as e:
+            logger.error(
+                "Failed to initialize LLM with model '%s': %s. "
+                "Check LLM_API_KEY and LLM_MODEL environment variables.",
+                model,
+                e,
+                exc_info=True,
+            )
+            # The cause is chained (and already logged); don't format it into the message
+            raise RuntimeError(
+                "Cannot initialize LLM. "
+                "Please check LLM_API_KEY and LLM_MODEL configuration."
+            ) from e
+        return agent
+
     def _init_remote_server(
         self, agent: Agent, openhands_config: OpenHandsConfig
     ) -> None:
         """Initialize connection to a remote OpenHands server."""
+        from openhands.sdk import RemoteConversation
+
         server_url = openhands_config.server_url
         api_key = openhands_config.api_key
         working_dir = openhands_config.working_dir
@@ -184,11 +473,9 @@ class OpenHandsLlmRepository(LlmRepository):
         logger.info("Connecting to remote OpenHands server at %s", server_url)
 
         try:
-            # Create RemoteWorkspace to connect to the OpenHands server
-            workspace = RemoteWorkspace(
-                host=server_url,
-                api_key=api_key,
-                working_dir=working_dir,
+            # Reuse (or create) the pooled RemoteWorkspace for this OpenHands server
+            workspace = self._acquire_remote_workspace(
+                server_url, api_key, working_dir, openhands_config.max_connections
             )
 
             # Create RemoteConversation which uses the workspace
@@ -204,15 +491,184 @@ class OpenHandsLlmRepository(LlmRepository):
                 server_url,
             )
         except Exception as e:
+            self._release_workspace()
             logger.error(
                 "Failed to connect to remote OpenHands server at %s: %s",
                 server_url,
                 e,
                 exc_info=True,
             )
-            raise RuntimeError(
-                f"Cannot connect to OpenHands server at {server_url}: {e}"
-            ) from e
+            raise RuntimeError(f"Cannot connect to OpenHands server at {server_url}") from e
+
+    def _acquire_remote_workspace(
+        self,
+        server_url: str,
+        api_key: str | None,
+        working_dir: str,
+        max_connections: int | None = None,
+    ) -> RemoteWorkspace:
+        """
+        Take a reference to the pooled RemoteWorkspace, creating it if needed.
+
+        The workspace owns a keep-alive httpx client that every RemoteConversation
+        on it reuses, so pooling the workspace also pools the server connections.
+        """
+        from openhands.sdk.workspace import RemoteWorkspace
+
+        key = (server_url, api_key, working_dir)
+        with self._WORKSPACE_POOL_LOCK:
+            entry = self._WORKSPACE_POOL.get(key)
+            if entry is None:
+                workspace_kwargs: dict[str, Any] = {}
+                # Only passed when set, so SDK releases without the setting keep working
+                if max_connections is not None:
+                    workspace_kwargs["max_connections"] = max_connections
+                workspace = RemoteWorkspace(
+                    host=server_url,
+                    api_key=api_key,
+                    working_dir=working_dir,
+                    **workspace_kwargs,
+                )
+                entry = _PooledWorkspace(workspace=workspace, close=workspace.reset_client)
+                self._WORKSPACE_POOL[key] = entry
+                metrics.counters[metrics.WORKSPACE_POOL_MISSES] += 1
+                logger.info("Created pooled RemoteWorkspace for %s", server_url)
+            else:
+                metrics.counters[metrics.WORKSPACE_POOL_HITS] += 1
+                logger.info("Reusing pooled RemoteWorkspace for %s", server_url)
+            entry.refs += 1
+            entry.last_used = time.monotonic()
+
+        self._workspace_key = key
+        return entry.workspace
+
+    def _acquire_docker_workspace(self, working_dir: str) -> DockerWorkspace:
+        """
+        Take a reference to the pooled DockerWorkspace, starting its container if needed.
+
+        The container stays warm after this repository releases it, so later
+        repositories skip the container start-up. The start itself (which may
+        pull the image) happens outside the pool lock; concurrent callers for
+        the same working_dir wait for it instead of starting a second container.
+        """
+        key = (_DOCKER_POOL_HOST, None, working_dir)
+        while True:
+            with self._WORKSPACE_POOL_LOCK:
+                entry = self._WORKSPACE_POOL.get(key)
+                if entry is not None:
+                    metrics.counters[metrics.WORKSPACE_POOL_HITS] += 1
+                    entry.refs += 1
+                    entry.last_used = time.monotonic()
+                    logger.info("Reusing pooled DockerWorkspace for %s", working_dir)
+                    break
+                starting = self._WORKSPACE_STARTING.get(key)
+                start_here = starting is None
+                if start_here:
+                    starting = self._WORKSPACE_STARTING[key] = Future()
+            if start_here:
+                entry = self._start_docker_workspace(key, working_dir, starting)
+                break
+            # Another repository is starting this container: wait, then take a reference
+            starting.result()
+
+        self._workspace_key = key
+        self._workspace_lock = entry.lock
+        return entry.workspace
+
+    def _start_docker_workspace(
+        self,
+        key: tuple[str, str | None, str],
+        working_dir: str,
+        starting: Future[None],
+    ) -> _PooledWorkspace:
+        """Start a container outside the pool lock and add it to the pool with one reference."""
+        from openhands.workspace import DockerWorkspace
+
+        try:
+            workspace = DockerWorkspace(working_dir=working_dir)
+        except BaseException as e:
+            with self._WORKSPACE_POOL_LOCK:
+                del self._WORKSPACE_STARTING[key]
+            starting.set_exception(e)
+            raise
+
+        entry = _PooledWorkspace(workspace=workspace, close=workspace.cleanup, refs=1)
+        with self._WORKSPACE_POOL_LOCK:
+            self._WORKSPACE_POOL[key] = entry
+            del self._WORKSPACE_STARTING[key]
+        starting.set_result(None)
+        metrics.counters[metrics.WORKSPACE_POOL_MISSES] += 1
+        logger.info("Created pooled DockerWorkspace for %s", working_dir)
+        return entry
+
+    def _release_workspace(self) -> None:
+        """Return this repository's reference to its pooled workspace, if any."""
+        key = self._workspace_key
+        if key is None:
+            return
+        self._workspace_key = None
+
+        with self._WORKSPACE_POOL_LOCK:
+            entry = self._WORKSPACE_POOL.get(key)
+            if entry is not None:
+                entry.refs = max(entry.refs - 1, 0)
+                entry.last_used = time.monotonic()
+
+    @classmethod
+    def cleanup_idle(cls, max_idle_s: float) -> int:
+        """
+        Evict pooled workspaces that are unreferenced and idle for longer than `max_idle_s`.
+
+        Args:
+            max_idle_s: Maximum idle time in seconds before an unused workspace is dropped
+
+        Returns:
+            Number of evicted workspaces
+        """
+        now = time.monotonic()
+        with cls._WORKSPACE_POOL_LOCK:
+            idle_keys = [
+                key
+                for key, entry in cls._WORKSPACE_POOL.items()
+                if entry.refs == 0 and now - entry.last_used > max_idle_s
+            ]
+            evicted = [cls._WORKSPACE_POOL.pop(key) for key in idle_keys]
+
+        cls._close_workspaces(evicted)
+        if evicted:
+            logger.info("Evicted %d idle pooled OpenHands workspace(s)", len(evicted))
+        return len(evicted)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled workspace (stopping Docker containers), in use or not."""
+        with cls._WORKSPACE_POOL_LOCK:
+            entries = list(cls._WORKSPACE_POOL.values())
+            cls._WORKSPACE_POOL.clear()
+        cls._close_workspaces(entries)
+
+    @staticmethod
+    def _close_workspaces(entries: Sequence[_PooledWorkspace]) -> None:
+        """Close workspaces in parallel; container shutdown can take a few seconds each."""
+        if not entries:
+            return
+
+        def close(entry: _PooledWorkspace) -> None:
+            try:
+                entry.close()
+            except Exception as e:
+                logger.warning("Failed to close pooled OpenHands workspace: %s", e)
+
+        threads = [threading.Thread(target=close, args=(entry,)) for entry in entries]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def __del__(self) -> None:
+        # Attributes may be missing if __init__ failed part-way
+        if getattr(self, "_workspace_key", None) is not None:
+            self._release_workspace()
 
     def _init_docker_workspace(
         self, agent: Agent, openhands_config: OpenHandsConfig | None
@@ -224,12 +680,13 @@ class OpenHandsLlmRepository(LlmRepository):
 
         try:
             logger.info("Initializing Docker workspace for agent execution")
-            workspace = DockerWorkspace(working_dir=working_dir)
+            workspace = self._acquire_docker_workspace(working_dir)
             self._conversation = Conversation(agent=agent, workspace=workspace)
             self._workspace = workspace
             logger.info("Initialized OpenHands with Docker workspace")
             return True
         except Exception as e:
+            self._release_workspace()
             logger.warning(
                 "Failed to initialize Docker workspace: %s. "
                 "Falling back to simple conversation mode.",
@@ -252,35 +709,30 @@ class OpenHandsLlmRepository(LlmRepository):
         Note: API key is optional in config (may be configured elsewhere),
         but will cause authentication errors if not provided.
         """
-        if not self._llm_config.api_key:
-            logger.warning(
-                "LLM_API_KEY is not set. This will cause authentication errors. "
-                "Please set the LLM_API_KEY environment variable with a valid API key. "
-                "For Deepseek, get your API key from https://platform.deepseek.com/"
-            )
-        elif not self._llm_config.api_key.strip():
-            logger.warning(
-                "LLM_API_KEY is set but empty. "
-                "Please provide a valid API key in the LLM_API_KEY environment variable."
-            )
+        model, api_key = self._llm_config.model, self._llm_config.api_key
+
+        if not api_key:
+            logger.warning(_MISSING_API_KEY_WARNING)
+        elif not api_key.strip():
+            logger.warning(_EMPTY_API_KEY_WARNING)
         
         # Check if model name looks valid
-        if not self._llm_config.model or not self._llm_config.model.strip():
-            logger.warning(
-                "LLM_MODEL is not set or empty. Using default 'deepseek'. "
-                "For Deepseek, you may need to use 'deepseek/deepseek-chat' format. "
-                "Set LLM_MODEL environment variable to override."
-            )
+        if not model or not model.strip():
+            logger.warning(_MISSING_MODEL_WARNING)
         
         logger.debug(
             "LLM configuration: model='%s', api_key_present=%s",
-            self._llm_config.model,
-            bool(self._llm_config.api_key),
+            model,
+            bool(api_key),
         )
 
     def _build_mcp_servers_config(self) -> dict[str, Any] | None:
         """
-        Build MCP servers configuration from environment variables and config.
+        Build MCP servers configuration from the environment snapshot and config.
+
+        Called once during initialization; the result is kept in `_mcp_servers_config`.
+        Equal configurations share a single dict across repositories, so callers
+        must treat it as read-only.
 
         Returns:
             Dictionary with mcpServers configuration format, or None if not configured.
@@ -289,57 +741,96 @@ class OpenHandsLlmRepository(LlmRepository):
             logger.debug("No MCP config provided, skipping MCP servers configuration")
             return None
 
-        # Build Atlassian MCP server config from environment variables
-        mcp_env = {}
-        for env_var in MCP_PROVIDER_ENV_VARS.get("atlassian", []):
-            value = os.environ.get(env_var)
-            if value:
-                mcp_env[env_var] = value
-
-        # Add optional env vars if present
-        for env_var in MCP_PROVIDER_OPTIONAL_ENV_VARS.get("atlassian", []):
-            value = os.environ.get(env_var)
-            if value:
-                mcp_env[env_var] = value
+        # Build Atlassian MCP server config from the environment snapshot
+        mcp_env = self._mcp_env_snapshot
 
         # If no environment variables are set, don't configure MCP
         if not mcp_env:
             logger.warning(
                 "MCP config provided but no Atlassian environment variables set. "
                 "Required: %s",
-                MCP_PROVIDER_ENV_VARS.get("atlassian", []),
+                sorted(MCP_PROVIDER_ENV_VARS.get("atlassian", ())),
             )
             return None
 
-        # Parse args from config (comma-separated string to list)
-        args = []
-        if self._mcp_config.args:
-            args = [arg.strip() for arg in self._mcp_config.args.split(",") if arg.strip()]
+        cache_key = (self._mcp_config.command, self._mcp_config.args, frozenset(mcp_env.items()))
+        mcp_servers = self._MCP_SERVERS_CACHE.get(cache_key)
+        if mcp_servers is not None:
+            return mcp_servers
 
         mcp_servers = {
             "atlassian": {
                 "command": self._mcp_config.command,
-                "args": args,
-                "env": mcp_env,
+                "args": list(self._mcp_config.args_list),
+                "env": dict(mcp_env),
             }
         }
+        self._MCP_SERVERS_CACHE[cache_key] = mcp_servers
 
-        logger.debug("Built MCP servers config: %s", list(mcp_servers.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Built MCP servers config: %s", list(mcp_servers.keys()))
         return mcp_servers
 
-    def _check_mcp_env_vars(self, provider: str) -> tuple[bool, list[str]]:
+    def _check_mcp_env_vars(self, provider: str) -> tuple[bool, tuple[str, ...]]:
         """
         Check if required environment variables for an MCP provider are set.
 
+        The result is memoized per provider until `refresh_mcp`, which the
+        connection TTL in `check_mcp_connection` also triggers.
+
         Args:
             provider: The MCP provider name (e.g., "atlassian")
 
         Returns:
             Tuple of (all_required_set, missing_vars)
         """
-        required_vars = MCP_PROVIDER_ENV_VARS.get(provider, [])
-        missing_vars = [var for var in required_vars if not os.environ.get(var)]
-        return len(missing_vars) == 0, missing_vars
+        cached = self._mcp_check_cache.get(provider)
+        if cached is not None:
+            metrics.counters[metrics.MCP_CHECK_CACHE_HITS] += 1
+            return cached
+
+        # The snapshot only holds non-empty variables, so membership is the whole check
+        missing = MCP_PROVIDER_ENV_VARS.get(provider, frozenset()) - self._mcp_env_snapshot.keys()
+        if not missing:
+            result: tuple[bool, tuple[str, ...]] = (True, ())
+        else:
+            # Sorted for stable messages; only paid when something is missing
+            result = (False, tuple(sorted(missing)))
+        self._mcp_check_cache[provider] = result
+        return result
+
+    def refresh_mcp(self) -> None:
+        """
+        Forget cached MCP state and re-read the MCP environment variables.
+
+        Drops the memoized env-var checks and connection marks, so the next
+        `check_mcp_connection` verifies everything again, and rebuilds the MCP
+        servers config. If that config changed after the agent was built, the
+        agent and shared conversation are replaced once the current run on the
+        shared conversation finishes; dedicated (batch/stream) runs keep theirs.
+        """
+        _build_atlassian_env.cache_clear()
+        self._mcp_env_snapshot = _build_atlassian_env()
+        self._mcp_check_cache.clear()
+        self._mcp_connected.clear()
+
+        with self._init_lock:
+            if self._initialized and self._agent is None:
+                # Injected client: its MCP setup is not managed here
+                return
+            mcp_servers = self._build_mcp_servers_config()
+            # Equal configs are shared through `_MCP_SERVERS_CACHE`, so identity means unchanged
+            if mcp_servers is self._mcp_servers_config:
+                return
+            self._mcp_servers_config = mcp_servers
+            if not self._initialized:
+                return
+            agent = self._build_agent()
+            # Swapped between runs: in-flight runs on the shared conversation finish first
+            with self._conversation_lock, self._workspace_run_guard():
+                self._agent = agent
+                conversation, self._conversation = self._conversation, self._create_conversation()
+            conversation.close()
 
     def check_mcp_connection(self, provider: str) -> bool:
         """
@@ -350,6 +841,11 @@ class OpenHandsLlmRepository(LlmRepository):
         2. MCP config is available
         3. The provider has been marked as connected
 
+        A provider marked as connected is trusted without re-checking until
+        `McpConfig.connection_ttl_seconds` elapses; after that the configuration
+        is re-verified and the mark renewed. With `McpConfig.prewarm` set, the
+        first successful verification also pre-warms the MCP server.
+
         Note:
             Full MCP health check (verifying the MCP server process is running
             and responsive) would require deeper integration. This check verifies
@@ -363,14 +859,19 @@ class OpenHandsLlmRepository(LlmRepository):
         """
         logger.info("Checking MCP connection for provider '%s'", provider)
 
-        # Check if already marked as connected
-        if self._mcp_connected.get(provider):
-            logger.info("MCP provider '%s' is already marked as connected", provider)
-            return True
+        # Check if already marked as connected and still within the TTL
+        connected_until = self._mcp_connected.get(provider)
+        if connected_until is not None:
+            if time.monotonic() < connected_until:
+                logger.info("MCP provider '%s' is already marked as connected", provider)
+                return True
+            # Mark expired: re-read the environment so the checks below see current values
+            self.refresh_mcp()
 
         # Check environment variables
         env_vars_ok, missing_vars = self._check_mcp_env_vars(provider)
         if not env_vars_ok:
+            self._mcp_connected.pop(provider, None)
             logger.warning(
                 "MCP provider '%s' missing required environment variables: %s",
                 provider,
@@ -380,12 +881,21 @@ class OpenHandsLlmRepository(LlmRepository):
 
         # Check MCP config
         if not self._mcp_config:
+            self._mcp_connected.pop(provider, None)
             logger.warning(
                 "MCP provider '%s' has environment variables but no MCP config",
                 provider,
             )
             return False
 
+        if connected_until is None and self._mcp_config.prewarm:
+            # First verification: start the server once, as `connect_mcp` would
+            self._prewarm_mcp_server(provider)
+            self._mark_mcp_connected(provider)
+        elif connected_until is not None:
+            # Connection mark expired but configuration is still valid: renew it
+            self._mark_mcp_connected(provider)
+
         logger.info(
             "MCP provider '%s' configuration verified (env vars and config present)",
             provider,
@@ -399,7 +909,8 @@ class OpenHandsLlmRepository(LlmRepository):
         MCP servers (like Atlassian) are configured via environment variables
         and mcpServers config in OpenHands. This method:
         1. Verifies required environment variables are set
-        2. Marks the provider as connected for subsequent checks
+        2. Optionally pre-warms the MCP server (`McpConfig.prewarm`)
+        3. Marks the provider as connected for subsequent checks
 
         Note:
             The actual MCP server connection is established lazily by OpenHands
@@ -414,7 +925,7 @@ class OpenHandsLlmRepository(LlmRepository):
         """
         logger.info("Connecting MCP provider '%s'", provider)
 
-        # Verify environment variables
+        # Verify environment variables (as read at startup or by the last `refresh_mcp`)
         env_vars_ok, missing_vars = self._check_mcp_env_vars(provider)
         if not env_vars_ok:
             error_msg = (
@@ -433,17 +944,99 @@ class OpenHandsLlmRepository(LlmRepository):
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+        if self._mcp_config.prewarm:
+            self._prewarm_mcp_server(provider)
+
         # Mark as connected
-        self._mcp_connected[provider] = True
+        self._mark_mcp_connected(provider)
         logger.info(
             "MCP provider '%s' marked as connected. "
             "Command: %s, Args: %s",
             provider,
             self._mcp_config.command,
-            self._mcp_config.args,
+            self._mcp_config.args_list,
         )
 
-    def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
+    def _prewarm_mcp_server(self, provider: str) -> bool:
+        """
+        Start the MCP server once and wait for its reply to an `initialize` request.
+
+        OpenHands starts its own MCP server process for each agent, so this
+        process is not kept. It still moves one-off startup costs (e.g. npx
+        fetching the package) out of the first agent run. Failures are logged
+        and ignored; the server is then simply started lazily as before.
+
+        Returns:
+            True if the server answered the handshake, False otherwise
+        """
+        command = [self._mcp_config.command, *self._mcp_config.args_list]
+        logger.info("Pre-warming MCP provider '%s'", provider)
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env={**os.environ, **self._mcp_env_snapshot},
+            )
+        except OSError as e:
+            logger.warning(
+                "Pre-warming MCP provider '%s' failed, falling back to lazy start: %s",
+                provider,
+                e,
+            )
+            return False
+
+        response: list[dict[str, Any]] = []
+
+        def read_response() -> None:
+            # stdio MCP servers write one JSON-RPC message per line; skip anything else
+            for line in process.stdout:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(message, dict) and message.get("id") == _MCP_INITIALIZE_REQUEST_ID:
+                    response.append(message)
+                    return
+
+        reader = threading.Thread(target=read_response, daemon=True)
+        reader.start()
+        try:
+            # stdin stays open: some servers exit on EOF before flushing their reply
+            process.stdin.write(_MCP_INITIALIZE_REQUEST + "\n")
+            process.stdin.flush()
+            reader.join(self._mcp_config.prewarm_timeout_seconds)
+        except OSError as e:
+            logger.warning(
+                "Pre-warming MCP provider '%s' failed, falling back to lazy start: %s",
+                provider,
+                e,
+            )
+            return False
+        finally:
+            # The server is not kept; stopping it also ends the reader at EOF
+            process.kill()
+            process.wait()
+
+        if not response or "result" not in response[0]:
+            logger.warning(
+                "MCP provider '%s' did not answer the initialize handshake "
+                "(%s), falling back to lazy start",
+                provider,
+                response[0].get("error") if response else "no reply",
+            )
+            return False
+
+        logger.info("MCP provider '%s' pre-warmed", provider)
+        return True
+
+    def _mark_mcp_connected(self, provider: str) -> None:
+        """Trust the provider's connection for the configured TTL."""
+        self._mcp_connected[provider] = time.monotonic() + self._mcp_config.connection_ttl_seconds
+
+    async def assign_agent(self, issue: IssueEntity, prompt: str) -> None:
         """
         Assign an agent in OpenHands for the given issue.
 
@@ -451,57 +1044,313 @@ class OpenHandsLlmRepository(LlmRepository):
         and sends it to an OpenHands Conversation to trigger an agent run.
         The response is not captured; the run is observable via OpenHands itself.
 
+        The OpenHands conversation API is synchronous, so the run happens in a
+        worker thread and the event loop stays free while the agent works.
+
         Args:
             issue: The issue entity (kept for logging purposes)
             prompt: The complete prompt string built by OrchestratorService
 
         Raises:
-            RuntimeError: If the conversation is not initialized or agent run fails
+            RuntimeError: If the conversation cannot be initialized or agent run fails
         """
+        await asyncio.to_thread(self._assign_agent_sync, issue, prompt)
+
+    def _assign_agent_sync(self, issue: IssueEntity, prompt: str) -> None:
+        """Blocking body of `assign_agent`; runs on the shared conversation."""
+        self._ensure_conversation()
+
         if self._conversation is None:
             error_msg = "Cannot assign agent: OpenHands conversation not initialized"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+        # Claimed before waiting for the conversation, so duplicates queued behind a run are skipped
+        with self._deduplicated_run(issue, prompt) as claimed:
+            if claimed:
+                with self._conversation_lock, self._workspace_run_guard():
+                    self._run_agent(self._conversation, issue, prompt)
+
+    async def assign_agents_batch(
+        self,
+        items: Sequence[tuple[IssueEntity, str]],
+        max_concurrency: int | None = None,
+    ) -> list[AgentRunResult]:
+        """
+        Run agents for several issues concurrently.
+
+        Each issue gets its own conversation on the shared agent and workspace so
+        that runs don't interleave. Failures are captured per item instead of
+        aborting the whole batch. Runs in a local Docker workspace share one
+        container and are therefore executed one at a time.
+
+        Items for the same issue key depend on each other (e.g. a review must
+        see the implementation's status change), so they run one after another
+        in input order; different issues run concurrently.
+
+        Args:
+            items: (issue, prompt) pairs; prompts are fully built by the domain layer
+            max_concurrency: Maximum number of agent runs in flight; defaults to
+                `LlmConfig.max_concurrent_runs`, which also caps larger values
+
+        Returns:
+            One AgentRunResult per item, in input order
+
+        Raises:
+            RuntimeError: If the OpenHands conversation cannot be initialized
+        """
+        if not items:
+            return []
+
+        await asyncio.to_thread(self._ensure_conversation)
+        max_runs = self._llm_config.max_concurrent_runs
+        if max_concurrency and max_concurrency > max_runs:
+            logger.warning(
+                "Batch max_concurrency %d exceeds LLM_MAX_CONCURRENT_RUNS (%d); "
+                "at most %d agent runs will be in flight",
+                max_concurrency,
+                max_runs,
+                max_runs,
+            )
+        semaphore = asyncio.Semaphore(min(max_concurrency or max_runs, max_runs))
+
+        # Issue key -> indexes of its items, in input order
+        chains: dict[str, list[int]] = {}
+        for index, (issue, _) in enumerate(items):
+            chains.setdefault(issue.key, []).append(index)
+
+        results: list[AgentRunResult | None] = [None] * len(items)
+
+        async def run_chain(indexes: list[int]) -> None:
+            for index in indexes:
+                issue, prompt = items[index]
+                try:
+                    async with semaphore:
+                        await asyncio.to_thread(self._run_isolated, issue, prompt)
+                except Exception as e:
+                    results[index] = AgentRunResult(issue=issue, ok=False, error=e)
+                else:
+                    results[index] = AgentRunResult(issue=issue, ok=True)
+
+        await asyncio.gather(*(run_chain(indexes) for indexes in chains.values()))
+        return results
+
+    async def stream_assign_agent(
+        self, issue: IssueEntity, prompt: str
+    ) -> AsyncIterator[str]:
+        """
+        Assign an agent for the given issue and yield its events as they happen.
+
+        The run uses a dedicated conversation whose event callback hands each
+        event to the event loop through an asyncio.Queue, so consumers (e.g. a
+        Jira comment poster or an SSE endpoint) see agent output while the run
+        is still in progress. Each yielded chunk is the event's plain-text form.
+
+        If the consumer stops iterating early, the agent run itself continues
+        in its worker thread until it completes.
+
+        Args:
+            issue: The issue entity (kept for logging purposes)
+            prompt: The complete prompt string built by OrchestratorService
+
+        Yields:
+            Plain-text representation of each conversation event
+
+        Raises:
+            RuntimeError: If the conversation cannot be created or the agent run fails
+        """
+        await asyncio.to_thread(self._ensure_conversation)
+
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[str | None] = asyncio.Queue()
+
+        def on_event(event: Any) -> None:
+            # Called from the agent's worker thread
+            loop.call_soon_threadsafe(events.put_nowait, str(event))
+
+        conversation = self._create_conversation(callbacks=[on_event])
+        if conversation is None:
+            error_msg = "Cannot stream agent output: an injected OpenHands client has no event hook"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        run = asyncio.ensure_future(
+            asyncio.to_thread(self._run_guarded, conversation, issue, prompt)
+        )
+        # Scheduled after every event callback the run made, so it marks the end of the stream
+        run.add_done_callback(lambda _: events.put_nowait(None))
+
+        while (chunk := await events.get()) is not None:
+            yield chunk
+        # Surface a failed run to the consumer
+        await run
+
+    def _create_conversation(
+        self, callbacks: list[Callable[[Any], None]] | None = None
+    ) -> RemoteConversation | Any:
+        """
+        Create a new conversation bound to the shared agent and workspace.
+
+        Args:
+            callbacks: Optional callbacks invoked with every conversation event
+
+        Returns None when the repository wraps an injected client, which cannot be cloned.
+        """
+        from openhands.sdk import Conversation, RemoteConversation
+
+        if self._agent is None:
+            return None
+        if self._uses_remote_server():
+            return RemoteConversation(
+                agent=self._agent,
+                workspace=self._workspace,
+                callbacks=callbacks,
+                visualizer=None,
+            )
+        if self._workspace is not None:
+            return Conversation(agent=self._agent, workspace=self._workspace, callbacks=callbacks)
+        return Conversation(agent=self._agent, callbacks=callbacks)
+
+    def _uses_remote_server(self) -> bool:
+        """Return True if agents run on a remote OpenHands server."""
+        return bool(self._openhands_config and self._openhands_config.server_url)
+
+    def _run_isolated(self, issue: IssueEntity, prompt: str) -> None:
+        """Run an agent for one issue on a dedicated conversation."""
+        conversation = self._create_conversation()
+        if conversation is None:
+            # Injected client: fall back to the shared conversation, one run at a time
+            with self._deduplicated_run(issue, prompt) as claimed:
+                if claimed:
+                    with self._conversation_lock:
+                        self._run_agent(self._conversation, issue, prompt)
+            return
+
+        self._run_guarded(conversation, issue, prompt)
+
+    def _run_guarded(
+        self, conversation: RemoteConversation | Any, issue: IssueEntity, prompt: str
+    ) -> None:
+        """Run the given dedicated conversation while holding the workspace guard, then close it."""
+        try:
+            with self._deduplicated_run(issue, prompt) as claimed:
+                if claimed:
+                    with self._workspace_run_guard():
+                        self._run_agent(conversation, issue, prompt)
+        finally:
+            # Releases the event client thread and, on a remote server, the server-side conversation
+            conversation.close()
+
+    def _workspace_run_guard(self) -> AbstractContextManager[Any]:
+        """
+        Return the context that an agent run must hold on this repository's workspace.
+
+        A Docker workspace is a single container shared through the pool, so its
+        runs cannot overlap; remote and simple-mode runs need no guard.
+        """
+        if self._workspace is not None and not self._uses_remote_server():
+            return self._workspace_lock
+        return nullcontext()
+
+    @contextmanager
+    def _deduplicated_run(self, issue: IssueEntity, prompt: str) -> Iterator[bool]:
+        """
+        Claim an agent run for de-duplication and yield whether it should go ahead.
+
+        With `LlmConfig.dedupe_ttl_seconds` set, a run whose issue key and prompt
+        match a run claimed or finished within the TTL is skipped. Callers claim
+        before taking any conversation or workspace lock, so duplicates queued
+        behind a running agent are skipped as well. A failed run frees its slot;
+        a successful one restarts the TTL when it finishes.
+        """
+        claimed, run_key = self._claim_run(issue, prompt)
+        if not claimed:
+            metrics.counters[metrics.DEDUPED_RUNS] += 1
+            logger.info(
+                "Skipping OpenHands agent run for issue %s: same prompt already run within %ss",
+                issue.key,
+                self._llm_config.dedupe_ttl_seconds,
+            )
+            yield False
+            return
+
+        try:
+            yield True
+        except BaseException:
+            if run_key is not None:
+                with self._RECENT_RUNS_LOCK:
+                    self._RECENT_RUNS.pop(run_key, None)
+            raise
+        if run_key is not None:
+            with self._RECENT_RUNS_LOCK:
+                self._RECENT_RUNS[run_key] = time.monotonic() + self._llm_config.dedupe_ttl_seconds
+
+    def _claim_run(self, issue: IssueEntity, prompt: str) -> tuple[bool, str | None]:
+        """
+        Record a run for de-duplication.
+
+        Returns:
+            Tuple of (claimed, run_key); claimed is False if an identical run was
+            claimed or finished within the TTL, run_key is None if de-duplication
+            is disabled
+        """
+        ttl = self._llm_config.dedupe_ttl_seconds
+        if not ttl:
+            return True, None
+
+        run_key = hashlib.sha256(f"{issue.key}\0{prompt}".encode()).hexdigest()
+        now = time.monotonic()
+        with self._RECENT_RUNS_LOCK:
+            for key in [key for key, until in self._RECENT_RUNS.items() if until <= now]:
+                del self._RECENT_RUNS[key]
+            if run_key in self._RECENT_RUNS:
+                return False, run_key
+            self._RECENT_RUNS[run_key] = now + ttl
+        return True, run_key
+
+    def _run_agent(
+        self, conversation: RemoteConversation | Any, issue: IssueEntity, prompt: str
+    ) -> None:
+        """
+        Send the prompt to the given conversation and run the agent to completion.
+
+        Raises:
+            RuntimeError: If the agent run fails
+        """
         logger.info(
             "Starting OpenHands agent run for issue %s with model '%s'",
             issue.key,
             self._llm_config.model,
         )
         logger.debug("Prompt length: %d characters", len(prompt))
+        metrics.counters[metrics.AGENT_RUNS] += 1
 
         try:
-            # Send the prompt (already built by domain layer) to the agent
-            self._conversation.send_message(prompt)
-            logger.info("Message sent to OpenHands agent for issue %s", issue.key)
+            with self._run_semaphore:
+                # Send the prompt (already built by domain layer) to the agent
+                conversation.send_message(prompt)
+                logger.info("Message sent to OpenHands agent for issue %s", issue.key)
 
-            # Run the conversation - this triggers the agent to process the prompt
-            self._conversation.run()
-            logger.info("OpenHands agent run completed for issue %s", issue.key)
+                # Run the conversation - this triggers the agent to process the prompt
+                conversation.run()
+                logger.info("OpenHands agent run completed for issue %s", issue.key)
 
         except Exception as e:
+            metrics.counters[metrics.AGENT_RUN_FAILURES] += 1
             error_str = str(e)
-            error_msg = f"Agent run failed for issue {issue.key}: {error_str}"
             
             # Provide specific guidance for authentication errors
-            if "Authentication" in error_str or "AuthenticationError" in error_str:
+            # ("Authentication" also matches "AuthenticationError")
+            if "Authentication" in error_str:
                 logger.error(
-                    "LLM Authentication failed for issue %s. "
-                    "Please check:\n"
-                    "  1. LLM_API_KEY is set correctly in environment variables\n"
-                    "  2. The API key is valid and not expired\n"
-                    "  3. The API key has proper permissions for the model '%s'\n"
-                    "  4. For Deepseek: Ensure you're using a valid Deepseek API key\n"
-                    "Error: %s",
+                    _AUTH_ERROR_LOG_TEMPLATE,
                     issue.key,
                     self._llm_config.model,
                     error_str,
                     exc_info=True,
                 )
                 raise RuntimeError(
-                    f"LLM Authentication failed for issue {issue.key}. "
-                    f"Please verify LLM_API_KEY is set correctly and valid. "
-                    f"Model: {self._llm_config.model}, Error: {error_str}"
+                    _AUTH_ERROR_MESSAGE_TEMPLATE % (issue.key, self._llm_config.model)
                 ) from e
             
             logger.error(
@@ -510,6 +1359,8 @@ class OpenHandsLlmRepository(LlmRepository):
                 error_str,
                 exc_info=True,
             )
-            raise RuntimeError(error_msg) from e
+            raise RuntimeError(f"Agent run failed for issue {issue.key}") from e
 
 
+# Stop pooled Docker containers and close HTTP clients on interpreter exit
+atexit.register(OpenHandsLlmRepository.close_all)
@@ -6,31 +6,87 @@ Provides structured logging with levels, timestamps, and stacktraces.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Background listener that owns the real handlers; see `setup_logging`
+_queue_listener: QueueListener | None = None
+# The QueueHandler we put on the root logger, to tell it apart from handlers others installed
+_queue_handler: QueueHandler | None = None
+# (level, log_file, enable_console) applied by the last `setup_logging` call
+_current_config: tuple[int, str | None, bool] | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush pending records, stop the background logging thread and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(
     log_level: str | int = logging.INFO,
     log_file: str | Path | None = None,
     enable_console: bool = True,
+    force: bool = False,
 ) -> None:
     """
     Configure Python logging with level-based logs, timestamps, and stacktraces.
 
+    Records are put on an in-memory queue by the root logger; a background
+    QueueListener thread formats them and writes to the console/file handlers,
+    so logging calls never block on stream or disk I/O.
+
+    Calling it again with the same arguments is a no-op; with different
+    arguments the previous handlers are closed and replaced.
+
+    When running under pytest, or when the root logger already has handlers
+    installed by someone else (e.g. pytest's caplog), those handlers are left
+    in place and no log file is opened, unless `force` is set.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL) or int
         log_file: Optional path to log file. If None, logs only to console.
         enable_console: Whether to output logs to console (stdout/stderr)
+        force: Replace foreign root handlers and write the log file regardless
     """
+    global _queue_listener, _queue_handler, _current_config
+
     # Convert string level to int if needed
     if isinstance(log_level, str):
         level = getattr(logging, log_level.upper(), logging.INFO)
     else:
         level = log_level
 
+    root_logger = logging.getLogger()
+    foreign_handlers = [h for h in root_logger.handlers if h is not _queue_handler]
+    cooperative = not force and (bool(os.environ.get("PYTEST_CURRENT_TEST")) or bool(foreign_handlers))
+    if cooperative:
+        # Someone else owns root logging (test harness, embedding app); don't add file I/O
+        log_file = None
+
+    config = (level, str(log_file) if log_file else None, enable_console)
+    if config == _current_config and (cooperative or not foreign_handlers):
+        return
+
+    if not cooperative:
+        # None of our formats use thread/process fields; skip collecting them per record.
+        # Process-wide, so only when every root handler is ours
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     # Create formatter with timestamp, level, logger name, and message
     # Include stacktrace for exceptions
     formatter = logging.Formatter(
@@ -60,7 +116,7 @@ def setup_logging(
 
         file_handler = RotatingFileHandler(
             log_path,
-            maxBytes=10 * 1024 * 1024,  # 10MB
+            maxBytes=64 * 1024 * 1024,  # 64MB
             backupCount=5,
             encoding="utf-8",
         )
@@ -69,15 +125,26 @@ def setup_logging(
         handlers.append(file_handler)
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
-    root_logger.handlers.clear()
-
-    # Add our handlers
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Remove (and close) existing handlers to avoid duplicates and leaked files;
+    # in cooperative mode only our own handler is replaced
+    for handler in root_logger.handlers[:]:
+        if cooperative and handler is not _queue_handler:
+            continue
+        root_logger.removeHandler(handler)
+        handler.close()
+    _queue_handler = None
+    _stop_queue_listener()
+
+    # Route records through a queue to the real handlers on a background thread
+    if handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        root_logger.addHandler(_queue_handler)
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+    _current_config = config
 
     # Set levels for third-party loggers to reduce noise
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -0,0 +1,86 @@
+"""
+Low-overhead process metrics for the AI Orchestrator.
+
+Hot paths bump integer slots in a shared array (`counters[AGENT_RUNS] += 1`):
+no function call, no allocation and no log record per event. A background
+reporter logs the totals periodically at INFO level.
+
+Increments are not locked; under heavy thread contention an occasional
+increment may be lost, which is acceptable for operational counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from array import array
+
+logger = logging.getLogger(__name__)
+
+# Counter slots
+AGENT_RUNS = 0
+AGENT_RUN_FAILURES = 1
+DEDUPED_RUNS = 2
+WORKSPACE_POOL_HITS = 3
+WORKSPACE_POOL_MISSES = 4
+MCP_CHECK_CACHE_HITS = 5
+
+_COUNTER_NAMES = (
+    "agent_runs",
+    "agent_run_failures",
+    "deduped_runs",
+    "workspace_pool_hits",
+    "workspace_pool_misses",
+    "mcp_check_cache_hits",
+)
+
+counters = array("Q", [0] * len(_COUNTER_NAMES))
+
+_reporter: threading.Thread | None = None
+_reporter_lock = threading.Lock()
+
+
+def snapshot() -> dict[str, int]:
+    """Return the current counter values by name."""
+    return dict(zip(_COUNTER_NAMES, counters))
+
+
+def start_reporter(interval_s: float = 60.0) -> None:
+    """
+    Start the background thread that logs counter totals every `interval_s` seconds.
+
+    Totals are only formatted when INFO logging is enabled and something changed
+    since the last report. The thread is a daemon and runs until the process
+    exits. Calling this more than once has no effect.
+
+    Args:
+        interval_s: Seconds between reports
+    """
+    global _reporter
+
+    with _reporter_lock:
+        if _reporter is not None:
+            return
+        _reporter = threading.Thread(
+            target=_report_forever,
+            args=(interval_s,),
+            name="metrics-reporter",
+            daemon=True,
+        )
+        _reporter.start()
+
+
+def _report_forever(interval_s: float) -> None:
+    """Reporter loop; see `start_reporter`."""
+    last = counters.tobytes()
+    while True:
+        time.sleep(interval_s)
+        current = counters.tobytes()
+        if current == last or not logger.isEnabledFor(logging.INFO):
+            continue
+        last = current
+        logger.info(
+            "Metrics: %s",
+            ", ".join("%s=%d" % item for item in snapshot().items()),
+        )